@@ -2,404 +2,965 @@ import streamlit as st
 import random
 import json
 import os
+import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime, time, timedelta
-import pytz
-from cryptography.fernet import Fernet
+from time import perf_counter
+from streamlit.logger import get_logger
 
 # ========== INITIAL SETUP ==========
-def get_encryption_key():
+# Streamlit re-executes this script on every rerun, so one-time setup
+# (crypto, timezone) is created lazily behind st.cache_resource.
+def process_start_time():
+    # Epoch seconds when this server process started, or None where there is no /proc
+    try:
+        with open("/proc/self/stat") as f:
+            # Fields after the parenthesized command name; starttime is field 22
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/stat") as f:
+            boot_time = next(int(line.split()[1]) for line in f if line.startswith("btime "))
+    except (OSError, ValueError, IndexError, StopIteration):
+        return None
+    return boot_time + start_ticks / os.sysconf("SC_CLK_TCK")
+
+@st.cache_resource(show_spinner=False)
+def get_startup_report():
+    # Cold-start timings in ms, recorded the first time each step runs in this process
+    return {}
+
+@contextmanager
+def startup_step(name):
+    start = perf_counter()
+    yield
+    get_startup_report().setdefault(name, round((perf_counter() - start) * 1000, 1))
+
+@st.cache_resource(show_spinner=False)
+def get_timezone():
+    with startup_step("timezone"):
+        import pytz
+        return pytz.timezone("Asia/Jakarta")
+
+def get_encryption_key(fernet):
     if not os.path.exists("secret.key"):
-        key = Fernet.generate_key()
+        # A fresh key can't decrypt existing passwords; never pair one with saved accounts
+        if os.path.exists("auth_config.json"):
+            raise ValueError("secret.key tidak ditemukan, padahal auth_config.json sudah ada")
+        key = fernet.generate_key()
         with open("secret.key", "wb") as key_file:
             key_file.write(key)
-    return open("secret.key", "rb").read()
+    with open("secret.key", "rb") as key_file:
+        return key_file.read()
+
+@st.cache_resource(show_spinner=False)
+def get_cipher():
+    with startup_step("cipher"):
+        from cryptography.fernet import Fernet
+        return Fernet(get_encryption_key(Fernet))
+
+# ========== RECORD TYPES ==========
+class Transfer:
+    # One plan row; bank, window and game-type strings are interned and shared across rows
+    __slots__ = ("akun", "bank", "tipe_game", "waktu_transfer", "status_akses", "jendela")
+
+    def __init__(self, akun, bank, tipe_game, waktu_transfer, status_akses, jendela):
+        self.akun = sys.intern(akun)
+        self.bank = sys.intern(bank)
+        self.tipe_game = sys.intern(tipe_game)
+        self.waktu_transfer = sys.intern(waktu_transfer)
+        self.status_akses = sys.intern(status_akses)
+        self.jendela = sys.intern(jendela)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(*(data[field] for field in cls.__slots__))
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
 
-cipher_suite = Fernet(get_encryption_key())
+class Account:
+    # Decrypted login for one site/bank pair
+    __slots__ = ("bank", "username", "password")
 
-# Initialize session state for dynamic bank input
-if 'bank_count' not in st.session_state:
-    st.session_state.bank_count = 1
-if 'edit_bank_count' not in st.session_state:
-    st.session_state.edit_bank_count = 1
+    def __init__(self, bank="", username="", password=""):
+        self.bank = sys.intern(bank)
+        self.username = username
+        self.password = password
+
+    def to_dict(self):
+        return {"bank": self.bank, "username": self.username, "password": self.password}
+
+def make_banks(banks):
+    # Site bank list stored as a tuple of interned names
+    return tuple(sys.intern(b) for b in banks)
 
 # ========== DATA MANAGEMENT ==========
+# Files without "schema_version" are version 0 and are migrated once on load.
+# Data is normalized when written, so current-version files are loaded as-is.
+SCHEMA_VERSION = 1
+
+def normalize_jendela(data):
+    if not isinstance(data, dict):
+        raise ValueError("jendela config must map window names to sites")
+    result = {}
+    for name, sites in data.items():
+        if not isinstance(name, str) or not name.strip() or not isinstance(sites, dict):
+            raise ValueError(f"Invalid window: {name!r}")
+        result[name] = {}
+        for site, banks in sites.items():
+            if not isinstance(site, str) or not site.strip():
+                raise ValueError(f"Invalid site in {name}: {site!r}")
+            banks = [b.strip() for b in banks if isinstance(b, str) and b.strip()]
+            if banks:
+                result[name][site] = banks
+    return result
+
+def normalize_accounts(data):
+    # Checks the encrypted form about to be written; passwords are never put in errors
+    if not isinstance(data, dict) or not isinstance(data.get("accounts"), dict):
+        raise ValueError("auth config must contain an accounts mapping")
+    result = {}
+    for site, acc_list in data["accounts"].items():
+        if not isinstance(site, str) or not site.strip() or not isinstance(acc_list, list):
+            raise ValueError(f"Invalid account list for {site!r}")
+        for acc in acc_list:
+            if not isinstance(acc, dict) or not all(isinstance(acc.get(f), str) for f in Account.__slots__):
+                raise ValueError(f"Invalid account for {site}")
+        result[site] = acc_list
+    return {"accounts": result}
+
+def normalize_history(data):
+    if not isinstance(data, dict) or "history" not in data or "status" not in data:
+        raise ValueError("history must contain history and status mappings")
+    result = {}
+    for date, rows in data["history"].items():
+        # Legacy non-date entries such as "last_jendela" are dropped
+        if not isinstance(rows, list):
+            continue
+        datetime.fromisoformat(date)
+        for t in rows:
+            if not isinstance(t, dict) or not all(isinstance(t.get(f), str) for f in Transfer.__slots__):
+                raise ValueError(f"Invalid transfer on {date}: {t!r}")
+        result[date] = rows
+    return {"history": result, "status": dict(data["status"])}
+
+def read_versioned(filename):
+    with open(filename, "r") as f:
+        data = json.load(f)
+    version = data.get("schema_version", 0) if isinstance(data, dict) else 0
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"{filename} has schema version {version}, newer than supported {SCHEMA_VERSION}")
+    return version, data
+
+def write_versioned(filename, data):
+    # Replace atomically so watching sessions never read a half-written file
+    with open(filename + ".tmp", "w") as f:
+        json.dump({"schema_version": SCHEMA_VERSION, **data}, f, indent=4)
+    os.replace(filename + ".tmp", filename)
+
 def load_jendela():
     if os.path.exists("jendela_config.json"):
-        with open("jendela_config.json", "r") as f:
-            data = json.load(f)
-            for window in data.values():
-                for site in list(window.keys()):
-                    window[site] = [b for b in window[site] if b and b.strip()]
-                    if not window[site]:
-                        del window[site]
-            return data
+        version, data = read_versioned("jendela_config.json")
+        if version < SCHEMA_VERSION:
+            # Version 0 kept the windows at the top level
+            data = {"jendela": normalize_jendela(data)}
+            write_versioned("jendela_config.json", data)
+        return {
+            sys.intern(name): {sys.intern(site): make_banks(banks) for site, banks in sites.items()}
+            for name, sites in data["jendela"].items()
+        }
     return {"jendela1": {}, "jendela2": {}, "jendela3": {}}
 
 def load_history():
     if os.path.exists("history_advanced.json"):
-        with open("history_advanced.json", "r") as f:
-            return json.load(f)
+        version, data = read_versioned("history_advanced.json")
+        if version < SCHEMA_VERSION:
+            data = normalize_history(data)
+            write_versioned("history_advanced.json", data)
+        return {
+            "history": {
+                date: [Transfer.from_dict(t) for t in rows]
+                for date, rows in data["history"].items()
+            },
+            "status": data["status"]
+        }
     return {"history": {}, "status": {}}
 
+# A Fernet token is version byte 0x80 then a 64-bit timestamp with zero high
+# bytes, so every token starts with "gAAAAA" in urlsafe base64
+FERNET_TOKEN_PREFIX = "gAAAAA"
+
+def decrypt_password(token):
+    from cryptography.fernet import InvalidToken
+    
+    if not isinstance(token, str):
+        raise ValueError("Password akun tidak valid")
+    try:
+        return get_cipher().decrypt(token.encode()).decode()
+    except InvalidToken:
+        raise ValueError("Password akun tidak bisa didekripsi, periksa secret.key") from None
+
 def load_accounts():
+    # Raises ValueError instead of returning empty accounts, so a bad key or
+    # unsupported file can never be saved back over the real account data
     if os.path.exists("auth_config.json"):
-        try:
-            with open("auth_config.json", "r") as f:
-                encrypted_data = json.load(f)
-                decrypted_data = {"accounts": {}}
-                for site, account_list in encrypted_data.get("accounts", {}).items():
-                    decrypted_data["accounts"][site] = []
-                    for account in account_list:
-                        if isinstance(account, dict) and "password" in account:
-                            try:
-                                decrypted_account = account.copy()
-                                decrypted_account["password"] = cipher_suite.decrypt(
-                                    account["password"].encode()
-                                ).decode()
-                                decrypted_data["accounts"][site].append(decrypted_account)
-                            except:
-                                decrypted_data["accounts"][site].append(account)
-                return decrypted_data
-        except:
-            st.error("Gagal load data akun!")
+        version, encrypted_data = read_versioned("auth_config.json")
+        decrypted_data = {"accounts": {}}
+        for site, account_list in encrypted_data.get("accounts", {}).items():
+            site_accounts = decrypted_data["accounts"][sys.intern(site)] = []
+            for account in account_list:
+                if version < SCHEMA_VERSION:
+                    # Version 0 could hold malformed entries and plaintext passwords
+                    if not (isinstance(account, dict) and "password" in account):
+                        continue
+                    try:
+                        password = decrypt_password(account["password"])
+                    except ValueError:
+                        # Only a password that was never encrypted may be kept as is;
+                        # a Fernet token means the key is wrong, and rewriting the
+                        # file under it would lose the password for good
+                        if not isinstance(account["password"], str) or \
+                                account["password"].startswith(FERNET_TOKEN_PREFIX):
+                            raise
+                        password = account["password"]
+                else:
+                    password = decrypt_password(account["password"])
+                site_accounts.append(Account(
+                    str(account.get("bank", "")),
+                    str(account.get("username", "")),
+                    password
+                ))
+        if version < SCHEMA_VERSION:
+            write_versioned("auth_config.json", normalize_accounts(accounts_to_json(decrypted_data)))
+        return decrypted_data
     return {"accounts": {}}
 
-def save_data():
-    # Clean empty banks first
-    for window in jendela.values():
-        for site in list(window.keys()):
-            window[site] = [b for b in window[site] if b and b.strip()]
-            if not window[site]:
-                del window[site]
-    
+def accounts_to_json(data):
     # Encrypt passwords
     accounts_data = {"accounts": {}}
-    for site in accounts["accounts"]:
+    for site, account_list in data["accounts"].items():
         accounts_data["accounts"][site] = []
-        for account in accounts["accounts"][site]:
-            encrypted_account = account.copy()
-            if "password" in encrypted_account:
-                encrypted_account["password"] = cipher_suite.encrypt(
-                    account["password"].encode()
-                ).decode()
+        for account in account_list:
+            encrypted_account = account.to_dict()
+            encrypted_account["password"] = get_cipher().encrypt(
+                account.password.encode()
+            ).decode()
             accounts_data["accounts"][site].append(encrypted_account)
+    return accounts_data
+
+def history_to_json():
+    return {
+        "history": {
+            date: [t.to_dict() for t in rows]
+            for date, rows in history["history"].items()
+        },
+        "status": history["status"]
+    }
+
+def save_jendela():
+    with writing_cached("jendela_config.json", jendela):
+        write_versioned("jendela_config.json", {"jendela": normalize_jendela(jendela)})
+
+def save_accounts():
+    with writing_cached("auth_config.json", accounts):
+        write_versioned("auth_config.json", normalize_accounts(accounts_to_json(accounts)))
+
+def save_history():
+    # Only called with get_history_lock() held, right after re-reading the history,
+    # so a config edit in one session can't overwrite another session's plans
+    with writing_cached("history_advanced.json", history):
+        write_versioned("history_advanced.json", normalize_history(history_to_json()))
+
+@st.cache_resource
+def get_history_lock():
+    # Shared by every session in this process so parallel window generation merges safely
+    return threading.Lock()
+
+# ========== CHANGE NOTIFICATION ==========
+# Another operator's session, another server process or a script may change
+# the data files. A process-wide watcher bumps a per-file version on every
+# change and reruns the open sessions, so idle ones pick it up on their own.
+DATA_FILES = ("jendela_config.json", "auth_config.json", "history_advanced.json")
+
+def file_signature(filename):
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+class DataWatcher:
+    def __init__(self):
+        from streamlit.watcher.path_watcher import get_path_watcher_class
+        
+        self.versions = dict.fromkeys(DATA_FILES, 0)
+        self._sessions = set()
+        self._own_writes = {}
+        self._stale = set()
+        self._lock = threading.Lock()
+        
+        # watchdog (inotify and friends) when installed, polling otherwise
+        watcher_class = get_path_watcher_class("auto")
+        self._watchers = [
+            watcher_class(
+                os.path.abspath(filename),
+                lambda _, filename=filename: self._on_changed(filename),
+                allow_nonexistent=True
+            )
+            for filename in DATA_FILES
+        ]
+
+    def register_session(self):
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        
+        ctx = get_script_run_ctx()
+        if ctx:
+            with self._lock:
+                self._sessions.add(ctx.session_id)
+
+    def expect_write(self, filename):
+        # Remember who wrote this version so that session isn't rerun for its own change
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        
+        ctx = get_script_run_ctx()
+        if ctx:
+            with self._lock:
+                self._own_writes[filename] = (file_signature(filename), ctx.session_id)
+
+    def _on_changed(self, filename):
+        with self._lock:
+            self.versions[filename] += 1
+            signature, writer = self._own_writes.pop(filename, (None, None))
+        if signature is None or signature != file_signature(filename):
+            writer = None
+        self._rerun_sessions(skip=writer)
+
+    def _rerun_sessions(self, skip=None):
+        from streamlit.runtime import Runtime
+        from streamlit.runtime.app_session import AppSessionState
+        
+        if not Runtime.exists():
+            return
+        # Streamlit has no public API for rerunning another session; with
+        # runOnSave it reruns a session after a source change the same way,
+        # passing the session's last client state so widget values are kept.
+        session_mgr = getattr(Runtime.instance(), "_session_mgr", None)
+        if session_mgr is None:
+            return
+        with self._lock:
+            sessions = list(self._sessions)
+        for session_id in sessions:
+            if session_id == skip:
+                continue
+            info = session_mgr.get_active_session_info(session_id)
+            if info is None:
+                # Closed or disconnected; it re-registers on its next run
+                with self._lock:
+                    self._sessions.discard(session_id)
+                    self._stale.discard(session_id)
+            elif getattr(info.session, "_state", None) == AppSessionState.APP_NOT_RUNNING:
+                info.session.request_rerun(info.session._client_state)
+            else:
+                # Mid-run, it may already have read the old file; a rerun request
+                # now would cut that run short, so it checks in when it finishes
+                with self._lock:
+                    self._stale.add(session_id)
+
+    def take_stale(self):
+        # True once per data change that happened while this session was running
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        
+        ctx = get_script_run_ctx()
+        if not ctx:
+            return False
+        with self._lock:
+            if ctx.session_id not in self._stale:
+                return False
+            self._stale.discard(ctx.session_id)
+        return True
+
+@st.cache_resource(show_spinner=False)
+def get_data_watcher():
+    with startup_step("watcher"):
+        return DataWatcher()
+
+def load_cached(filename, loader):
+    # This session's parsed copy is reused until the file's version is bumped,
+    # and even then only re-parsed if the file differs from what it last read or wrote
+    watcher = get_data_watcher()
+    watcher.register_session()
+    cache = st.session_state.setdefault("data_cache", {})
+    version = watcher.versions[filename]
     
-    # Save all files
-    with open("jendela_config.json", "w") as f:
-        json.dump(jendela, f, indent=4)
-    
-    with open("auth_config.json", "w") as f:
-        json.dump(accounts_data, f, indent=4)
+    if filename in cache:
+        cached_version, signature, data = cache[filename]
+        if cached_version == version:
+            return data
+        if signature == file_signature(filename):
+            cache[filename] = (version, signature, data)
+            return data
     
-    with open("history_advanced.json", "w") as f:
-        json.dump(history, f, indent=4)
+    # Stat before reading so a write racing the read still looks changed next time
+    signature = file_signature(filename)
+    data = loader()
+    cache[filename] = (version, signature, data)
+    return data
+
+@contextmanager
+def writing_cached(filename, data):
+    # After a successful write this session keeps its copy, so its own change
+    # isn't re-parsed. The UI edits the copy in place before saving, so if the
+    # write fails the copy is dropped and the next run reads the file again.
+    watcher = get_data_watcher()
+    cache = st.session_state.setdefault("data_cache", {})
+    try:
+        yield
+    except Exception:
+        cache.pop(filename, None)
+        raise
+    watcher.expect_write(filename)
+    cache[filename] = (watcher.versions[filename], file_signature(filename), data)
 
 # ========== CORE FUNCTIONS ==========
 def clean_old_history():
-    today = datetime.now(pytz.timezone("Asia/Jakarta")).date()
+    today = datetime.now(get_timezone()).date()
     expired = [k for k in history["history"] 
-              if k != "last_jendela" 
-              and (today - datetime.fromisoformat(k).date()).days > 10]
+              if (today - datetime.fromisoformat(k).date()).days > 10]
     
     for date in expired:
         del history["history"][date]
     return len(expired)
 
-def generate_transfers():
-    today = datetime.now(pytz.timezone("Asia/Jakarta"))
-    date_key = today.date().isoformat()
-    
-    if date_key in history["history"] and not st.session_state.get('override', False):
-        return False
-    
+def generate_window(jendela_name, accounts_in_window, now):
     result = []
-    is_hongkong = time(14, 0) <= today.time() <= time(23, 59)
+    tipe_game = "Hongkong" if time(14, 0) <= now.time() <= time(23, 59) else "Sidney"
+    waktu_transfer = now.isoformat()
     
-    for jendela_name, accounts_in_window in jendela.items():
-        if not accounts_in_window:
-            continue
-            
-        shuffled_accounts = random.sample(list(accounts_in_window.items()), len(accounts_in_window))
+    shuffled_accounts = random.sample(list(accounts_in_window.items()), len(accounts_in_window))
+    
+    for acc, banks in shuffled_accounts:
+        bank = random.choice(banks)
+        status_key = f"{acc}_{bank}"
         
-        for acc, banks in shuffled_accounts:
-            valid_banks = [b for b in banks if b and b.strip()]
-            if not valid_banks:
-                continue
-                
-            bank = random.choice(valid_banks)
-            status_key = f"{acc}_{bank}"
-            
-            result.append({
-                "akun": acc,
-                "bank": bank,
-                "tipe_game": "Hongkong" if is_hongkong else "Sidney",
-                "waktu_transfer": today.isoformat(),
-                "status_akses": history["status"].get(status_key, "OK"),
-                "jendela": jendela_name
-            })
+        result.append(Transfer(
+            acc,
+            bank,
+            tipe_game,
+            waktu_transfer,
+            history["status"].get(status_key, "OK"),
+            jendela_name
+        ))
+    return result
+
+def generate_transfers(window_names=None):
+    global history
+    today = datetime.now(get_timezone())
+    date_key = today.date().isoformat()
+    # An empty list means no windows, and windows without sites have nothing to plan
+    targets = [w for w in (jendela if window_names is None else window_names) if jendela.get(w)]
     
-    expired_count = clean_old_history()
-    history["history"][date_key] = result
-    save_data()
+    with get_history_lock():
+        # Reload so windows generated by other sessions in the meantime are kept
+        history = load_history()
+        day = history["history"].get(date_key, [])
+        
+        # Without override, only windows that have no plan yet today are generated
+        if not st.session_state.get('override', False):
+            generated = {t.jendela for t in day}
+            targets = [w for w in targets if w not in generated]
+        if not targets:
+            return False
+        
+        plans = {w: generate_window(w, jendela[w], today) for w in targets}
+        kept = [t for t in day if t.jendela not in plans]
+        
+        expired_count = clean_old_history()
+        history["history"][date_key] = kept + [t for w in targets for t in plans[w]]
+        save_history()
     return expired_count
 
-# ========== STREAMLIT UI ==========
-st.set_page_config(layout="wide", page_title="Auto Transfer Pro")
-st.title("🔄 Auto Transfer Generator Pro")
-st.caption("Multi-Account Support | Secure Storage | Dynamic Bank Input")
-
-# Load all data
-jendela = load_jendela()
-history = load_history()
-accounts = load_accounts()
-today_key = datetime.now(pytz.timezone("Asia/Jakarta")).date().isoformat()
-
-# ========== MAIN TABS ==========
-tab1, tab2, tab3 = st.tabs(["Generate Transfer", "Manage Sites", "Account Management"])
-
-with tab1:
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        st.subheader("🔁 Buat Urutan Transfer")
-    with col2:
-        st.session_state.override = st.checkbox("Force Regenerate")
+def move_window_plan(old_name, new_name=None):
+    # Today's rows follow a renamed window, and go away with a deleted one
+    global history
+    if old_name == new_name:
+        return
+    date_key = datetime.now(get_timezone()).date().isoformat()
     
-    if st.button("🚀 Generate Sekarang", type="primary", use_container_width=True):
-        if not any(jendela.values()):
-            st.error("Belum ada situs terdaftar!")
+    with get_history_lock():
+        history = load_history()
+        day = history["history"].get(date_key)
+        if not day or not any(t.jendela == old_name for t in day):
+            return
+        if new_name is None:
+            history["history"][date_key] = [t for t in day if t.jendela != old_name]
         else:
-            with st.spinner("Memproses..."):
-                expired_count = generate_transfers()
-                if expired_count > 0:
-                    st.info(f"Data expired {expired_count} hari dihapus")
-                st.success("Generate berhasil!")
+            for t in day:
+                if t.jendela == old_name:
+                    t.jendela = sys.intern(new_name)
+        save_history()
+
+# ========== EXPORT ==========
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "tsv": "text/tab-separated-values"
+}
+
+def iter_transfers(data, start, end=None, window_names=None):
+    # Yields (date, transfer) for days start..end, oldest first
+    start = str(start)
+    end = str(end) if end else start
+    wanted = set(window_names) if window_names is not None else None
     
-    if today_key in history["history"]:
-        st.divider()
-        st.subheader(f"📋 Hasil {today_key}")
+    date_keys = sorted(
+        k for k in data["history"]
+        if start <= k <= end
+    )
+    for date_key in date_keys:
+        for t in data["history"][date_key]:
+            if wanted is None or t.jendela in wanted:
+                yield date_key, t
+
+def iter_export(fmt, start, end=None, window_names=None, data=None):
+    # Streams the export one row at a time instead of building the whole file
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if data is None:
+        data = load_history()
+    rows = iter_transfers(data, start, end, window_names)
+    
+    if fmt == "jsonl":
+        for date_key, t in rows:
+            yield json.dumps({"tanggal": date_key, **t.to_dict()}) + "\n"
+        return
+    
+    import csv
+    import io
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter="\t" if fmt == "tsv" else ",")
+    writer.writerow(("tanggal",) + Transfer.__slots__)
+    for date_key, t in rows:
+        writer.writerow((date_key,) + tuple(getattr(t, field) for field in Transfer.__slots__))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+def export_transfers(out, fmt="csv", start=None, end=None, window_names=None, data=None):
+    # out is a path or an open text file; defaults to today's plan for every window
+    if start is None:
+        start = datetime.now(get_timezone()).date()
+    if isinstance(out, (str, os.PathLike)):
+        with open(out, "w", newline="", encoding="utf-8") as f:
+            f.writelines(iter_export(fmt, start, end, window_names, data))
+    else:
+        out.writelines(iter_export(fmt, start, end, window_names, data))
+
+# ========== STREAMLIT UI ==========
+def try_save(save):
+    # Invalid data is shown as an error instead of a traceback
+    try:
+        save()
+    except ValueError as e:
+        st.error(f"Data tidak valid: {e}")
+        return False
+    return True
+
+def main():
+    cold_start = "first_page" not in get_startup_report()
+    with startup_step("first_page"):
+        render_app()
+    if cold_start:
+        started = process_start_time()
+        if started is not None:
+            get_startup_report()["process_start_to_first_page"] = round(
+                (datetime.now().timestamp() - started) * 1000
+            )
+        # Also goes to the server log so restarts can be compared
+        get_logger(__name__).info("Startup timing (ms): %s", get_startup_report())
+    with st.sidebar.expander("⏱️ Startup timing"):
+        st.json(get_startup_report())
+    if get_data_watcher().take_stale():
+        # A data file changed while this run was using it
+        st.rerun()
+
+def render_app():
+    global jendela, history, accounts
+    st.set_page_config(layout="wide", page_title="Auto Transfer Pro")
+    st.title("🔄 Auto Transfer Generator Pro")
+    st.caption("Multi-Account Support | Secure Storage | Dynamic Bank Input")
+    
+    # Initialize session state for dynamic bank input
+    if 'bank_count' not in st.session_state:
+        st.session_state.bank_count = 1
+    if 'edit_bank_count' not in st.session_state:
+        st.session_state.edit_bank_count = 1
+    
+    # Load all data; stop before anything can be saved if a file can't be used
+    try:
+        with startup_step("load_jendela"):
+            jendela = load_cached("jendela_config.json", load_jendela)
+        with startup_step("load_history"):
+            history = load_cached("history_advanced.json", load_history)
+        with startup_step("load_accounts"):
+            accounts = load_cached("auth_config.json", load_accounts)
+    except ValueError as e:
+        st.error(f"Data config tidak valid: {e}")
+        st.stop()
+    today_key = datetime.now(get_timezone()).date().isoformat()
+    
+    # ========== MAIN TABS ==========
+    tab1, tab2, tab3 = st.tabs(["Generate Transfer", "Manage Sites", "Account Management"])
+
+    with tab1:
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.subheader("🔁 Buat Urutan Transfer")
+        with col2:
+            st.session_state.override = st.checkbox("Force Regenerate")
+    
+        window_names = list(jendela.keys())
+        selected_windows = st.multiselect(
+            "Jendela", window_names, default=window_names, key="generate_windows"
+        )
+    
+        if st.button("🚀 Generate Sekarang", type="primary", use_container_width=True):
+            if not any(jendela[w] for w in selected_windows):
+                st.error("Belum ada situs terdaftar!")
+            else:
+                with st.spinner("Memproses..."):
+                    expired_count = generate_transfers(selected_windows)
+                    if expired_count is False:
+                        st.warning("Jendela terpilih sudah di-generate hari ini atau belum punya situs")
+                    else:
+                        if expired_count > 0:
+                            st.info(f"Data expired {expired_count} hari dihapus")
+                        st.success("Generate berhasil!")
+    
+        if today_key in history["history"]:
+            st.divider()
+            st.subheader(f"📋 Hasil {today_key}")
+        
+            # Only the selected windows are rendered
+            wanted = set(selected_windows)
+            window_groups = {}
+            for transfer in history["history"][today_key]:
+                window = transfer.jendela
+                if window in wanted:
+                    window_groups.setdefault(window, []).append(transfer)
         
-        window_groups = {}
-        for transfer in history["history"][today_key]:
-            window = transfer["jendela"]
-            window_groups.setdefault(window, []).append(transfer)
+            if not window_groups:
+                st.info("Belum ada hasil untuk jendela yang dipilih")
         
-        cols = st.columns(3)
-        for idx, (window, transfers) in enumerate(window_groups.items()):
-            with cols[idx % 3]:
-                with st.expander(f"🪟 {window.upper()} ({len(transfers)} transfer)", expanded=True):
-                    for t in transfers:
-                        matched_accounts = []
-                        if t['akun'] in accounts["accounts"]:
-                            matched_accounts = [
-                                acc for acc in accounts["accounts"][t['akun']] 
-                                if acc.get("bank") == t['bank']
-                            ]
+            cols = st.columns(3)
+            for idx, (window, transfers) in enumerate(window_groups.items()):
+                with cols[idx % 3]:
+                    with st.expander(f"🪟 {window.upper()} ({len(transfers)} transfer)", expanded=True):
+                        for t in transfers:
+                            matched_accounts = []
+                            if t.akun in accounts["accounts"]:
+                                matched_accounts = [
+                                    acc for acc in accounts["accounts"][t.akun] 
+                                    if acc.bank == t.bank
+                                ]
                         
-                        st.markdown(f"""
-                        **{t['akun']}** → `{t['bank']}`  
-                        🎮 **{t['tipe_game']}**  
-                        ⏱️ {datetime.fromisoformat(t['waktu_transfer']).strftime('%H:%M')}  
-                        {"🟢" if t['status_akses'] == "OK" else "🔴"} {t['status_akses']}
-                        """)
+                            st.markdown(f"""
+                            **{t.akun}** → `{t.bank}`  
+                            🎮 **{t.tipe_game}**  
+                            ⏱️ {datetime.fromisoformat(t.waktu_transfer).strftime('%H:%M')}  
+                            {"🟢" if t.status_akses == "OK" else "🔴"} {t.status_akses}
+                            """)
                         
-                        if matched_accounts:
-                            with st.popover("🔑 Lihat Login"):
-                                for acc in matched_accounts:
-                                    st.write(f"👤 `{acc.get('username', 'N/A')}`")
-                                    st.write(f"🔒 `{acc.get('password', 'N/A')}`")
-                                    st.divider()
-                        else:
-                            st.warning("Tidak ada akun untuk bank ini!")
-                        st.divider()
+                            if matched_accounts:
+                                with st.popover("🔑 Lihat Login"):
+                                    for acc in matched_accounts:
+                                        st.write(f"👤 `{acc.username or 'N/A'}`")
+                                        st.write(f"🔒 `{acc.password or 'N/A'}`")
+                                        st.divider()
+                            else:
+                                st.warning("Tidak ada akun untuk bank ini!")
+                            st.divider()
+    
+        st.divider()
+        with st.expander("📤 Export"):
+            today = datetime.now(get_timezone()).date()
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                export_dates = st.date_input("Tanggal", value=(today, today), key="export_dates")
+            with col2:
+                export_window = st.selectbox("Jendela", ["Semua"] + list(jendela.keys()), key="export_window")
+            with col3:
+                export_format = st.selectbox("Format", list(EXPORT_FORMATS), key="export_format")
+        
+            # The range picker returns a single date while the end is still being chosen
+            start, end = (export_dates[0], export_dates[-1]) if export_dates else (today, today)
+            export_windows = None if export_window == "Semua" else [export_window]
+            suffix = "" if export_windows is None else f"_{export_window}"
+        
+            # Only built when asked for and kept for this selection, so other reruns
+            # don't re-serialize the whole range; a history change makes it stale
+            selection = (export_format, start, end, export_window,
+                         get_data_watcher().versions["history_advanced.json"])
+            if st.button("📦 Siapkan export", use_container_width=True):
+                content = "".join(iter_export(export_format, start, end, export_windows, history)).encode("utf-8")
+                st.session_state.export_file = (selection, content)
+        
+            prepared = st.session_state.get("export_file")
+            if prepared and prepared[0] == selection:
+                st.download_button(
+                    "⬇️ Download",
+                    prepared[1],
+                    file_name=f"transfer_{start}_{end}{suffix}.{export_format}",
+                    mime=EXPORT_FORMATS[export_format],
+                    use_container_width=True
+                )
 
-with tab2:
-    st.subheader("🗃️ Kelola Situs")
+    with tab2:
+        st.subheader("🗃️ Kelola Situs")
     
-    crud_tabs = st.tabs(["Lihat Situs", "Tambah Situs", "Edit/Hapus"])
+        crud_tabs = st.tabs(["Lihat Situs", "Tambah Situs", "Edit/Hapus", "Kelola Jendela"])
     
-    with crud_tabs[0]:
-        st.write("### Daftar Situs Terdaftar")
-        for window_name, sites in jendela.items():
-            with st.expander(f"🪟 {window_name.upper()} ({len(sites)} situs)"):
-                if not sites:
-                    st.write("Belum ada situs")
-                    continue
+        with crud_tabs[0]:
+            st.write("### Daftar Situs Terdaftar")
+            for window_name, sites in jendela.items():
+                with st.expander(f"🪟 {window_name.upper()} ({len(sites)} situs)"):
+                    if not sites:
+                        st.write("Belum ada situs")
+                        continue
                 
-                cols = st.columns(3)
-                for i, (site, banks) in enumerate(sites.items()):
-                    cols[i%3].markdown(f"""
-                    **{site}**  
-                    🏦: {', '.join(banks)}
-                    """)
+                    cols = st.columns(3)
+                    for i, (site, banks) in enumerate(sites.items()):
+                        cols[i%3].markdown(f"""
+                        **{site}**  
+                        🏦: {', '.join(banks)}
+                        """)
     
-    with crud_tabs[1]:
-        st.write("### Tambah Situs Baru")
+        with crud_tabs[1]:
+            st.write("### Tambah Situs Baru")
         
-        # Tombol tambah bank di luar form
-        if st.button("➕ Tambah Bank", key="add_bank_main"):
-            st.session_state.bank_count += 1
-            st.rerun()
+            # Tombol tambah bank di luar form
+            if st.button("➕ Tambah Bank", key="add_bank_main"):
+                st.session_state.bank_count += 1
+                st.rerun()
         
-        with st.form("add_site_form", clear_on_submit=True):
-            window = st.selectbox("Jendela", list(jendela.keys()))
-            site_name = st.text_input("Nama Situs*")
+            with st.form("add_site_form", clear_on_submit=True):
+                window = st.selectbox("Jendela", list(jendela.keys()))
+                site_name = st.text_input("Nama Situs*")
             
-            banks = []
-            for i in range(st.session_state.bank_count):
-                bank = st.text_input(f"Bank {i+1}", key=f"bank_{i}", placeholder="BCA")
-                if bank and bank.strip():
-                    banks.append(bank.strip())
+                banks = []
+                for i in range(st.session_state.bank_count):
+                    bank = st.text_input(f"Bank {i+1}", key=f"bank_{i}", placeholder="BCA")
+                    if bank and bank.strip():
+                        banks.append(bank.strip())
             
-            if st.form_submit_button("💾 Simpan"):
-                if not site_name or not banks:
-                    st.error("Harap isi nama situs dan minimal 1 bank!")
-                else:
-                    jendela[window][site_name] = banks
-                    save_data()
-                    st.session_state.bank_count = 1  # Reset counter
-                    st.success(f"Situs {site_name} ditambahkan!")
-                    st.rerun()
+                if st.form_submit_button("💾 Simpan"):
+                    site_name = site_name.strip()
+                    if not window:
+                        st.error("Tambahkan jendela terlebih dahulu!")
+                    elif not site_name or not banks:
+                        st.error("Harap isi nama situs dan minimal 1 bank!")
+                    else:
+                        jendela[window][site_name] = make_banks(banks)
+                        if try_save(save_jendela):
+                            st.session_state.bank_count = 1  # Reset counter
+                            st.success(f"Situs {site_name} ditambahkan!")
+                            st.rerun()
     
-    with crud_tabs[2]:
-        st.write("### Edit Situs")
-        selected_window = st.selectbox("Pilih Jendela", list(jendela.keys()), key="edit_window")
+        with crud_tabs[2]:
+            st.write("### Edit Situs")
+            selected_window = st.selectbox("Pilih Jendela", list(jendela.keys()), key="edit_window")
         
-        if jendela[selected_window]:
-            selected_site = st.selectbox("Pilih Situs", list(jendela[selected_window].keys()), key="edit_site")
-            current_banks = jendela[selected_window][selected_site]
+            if selected_window and jendela[selected_window]:
+                selected_site = st.selectbox("Pilih Situs", list(jendela[selected_window].keys()), key="edit_site")
+                current_banks = jendela[selected_window][selected_site]
             
-            # Tombol tambah bank di luar form
-            if st.button("➕ Tambah Bank Baru", key="add_bank_edit"):
-                st.session_state.edit_bank_count = len(current_banks) + 1
-                st.rerun()
+                # Tombol tambah bank di luar form
+                if st.button("➕ Tambah Bank Baru", key="add_bank_edit"):
+                    st.session_state.edit_bank_count = len(current_banks) + 1
+                    st.rerun()
             
-            with st.form("edit_site_form"):
-                new_name = st.text_input("Nama Baru", value=selected_site)
+                with st.form("edit_site_form"):
+                    new_name = st.text_input("Nama Baru", value=selected_site)
                 
-                new_banks = []
-                display_count = max(len(current_banks), st.session_state.get('edit_bank_count', 1))
-                for i in range(display_count):
-                    bank_value = current_banks[i] if i < len(current_banks) else ""
-                    new_bank = st.text_input(f"Bank {i+1}", value=bank_value, key=f"edit_bank_{i}")
-                    if new_bank and new_bank.strip():
-                        new_banks.append(new_bank.strip())
+                    new_banks = []
+                    display_count = max(len(current_banks), st.session_state.get('edit_bank_count', 1))
+                    for i in range(display_count):
+                        bank_value = current_banks[i] if i < len(current_banks) else ""
+                        new_bank = st.text_input(f"Bank {i+1}", value=bank_value, key=f"edit_bank_{i}")
+                        if new_bank and new_bank.strip():
+                            new_banks.append(new_bank.strip())
                 
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.form_submit_button("💾 Update"):
-                        if not new_banks:
-                            st.error("Harap isi minimal 1 bank!")
-                        else:
-                            if new_name != selected_site:
-                                del jendela[selected_window][selected_site]
-                            jendela[selected_window][new_name] = new_banks
-                            save_data()
-                            st.session_state.edit_bank_count = len(new_banks)
-                            st.success("Data diperbarui!")
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        if st.form_submit_button("💾 Update"):
+                            new_name = new_name.strip()
+                            if not new_name:
+                                st.error("Harap isi nama situs!")
+                            elif new_name != selected_site and new_name in jendela[selected_window]:
+                                st.error(f"Situs {new_name} sudah ada!")
+                            elif not new_banks:
+                                st.error("Harap isi minimal 1 bank!")
+                            else:
+                                if new_name != selected_site:
+                                    del jendela[selected_window][selected_site]
+                                jendela[selected_window][new_name] = make_banks(new_banks)
+                                if try_save(save_jendela):
+                                    st.session_state.edit_bank_count = len(new_banks)
+                                    st.success("Data diperbarui!")
+                                    st.rerun()
+                    with col2:
+                        if st.form_submit_button("🗑️ Hapus", type="secondary"):
+                            del jendela[selected_window][selected_site]
+                            if try_save(save_jendela):
+                                st.success("Situs dihapus!")
+                                st.rerun()
+            else:
+                st.warning("Tidak ada situs di jendela ini")
+    
+        with crud_tabs[3]:
+            st.write("### Tambah Jendela")
+            with st.form("add_window_form", clear_on_submit=True):
+                new_window = st.text_input("Nama Jendela*", placeholder=f"jendela{len(jendela) + 1}")
+            
+                if st.form_submit_button("➕ Tambah Jendela"):
+                    new_window = new_window.strip()
+                    if not new_window:
+                        st.error("Harap isi nama jendela!")
+                    elif new_window in jendela:
+                        st.error(f"Jendela {new_window} sudah ada!")
+                    else:
+                        jendela[new_window] = {}
+                        if try_save(save_jendela):
+                            st.success(f"Jendela {new_window} ditambahkan!")
                             st.rerun()
-                with col2:
-                    if st.form_submit_button("🗑️ Hapus", type="secondary"):
-                        del jendela[selected_window][selected_site]
-                        save_data()
-                        st.success("Situs dihapus!")
-                        st.rerun()
-        else:
-            st.warning("Tidak ada situs di jendela ini")
+        
+            st.write("### Rename/Hapus Jendela")
+            if jendela:
+                target_window = st.selectbox("Pilih Jendela", list(jendela.keys()), key="manage_window")
+            
+                with st.form("edit_window_form"):
+                    renamed = st.text_input("Nama Baru", value=target_window)
+                
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        if st.form_submit_button("💾 Rename"):
+                            renamed = renamed.strip()
+                            if not renamed:
+                                st.error("Harap isi nama jendela!")
+                            elif renamed != target_window and renamed in jendela:
+                                st.error(f"Jendela {renamed} sudah ada!")
+                            else:
+                                # Rebuild in place to keep window order
+                                reordered = {
+                                    (renamed if name == target_window else name): sites
+                                    for name, sites in jendela.items()
+                                }
+                                jendela.clear()
+                                jendela.update(reordered)
+                                if try_save(save_jendela):
+                                    move_window_plan(target_window, renamed)
+                                    st.success("Jendela diperbarui!")
+                                    st.rerun()
+                    with col2:
+                        if st.form_submit_button("🗑️ Hapus", type="secondary"):
+                            del jendela[target_window]
+                            if try_save(save_jendela):
+                                move_window_plan(target_window)
+                                st.success(f"Jendela {target_window} dihapus!")
+                                st.rerun()
+            else:
+                st.warning("Belum ada jendela")
 
-with tab3:
-    st.subheader("🔐 Kelola Akun Login")
+    with tab3:
+        st.subheader("🔐 Kelola Akun Login")
     
-    # Get all site-bank pairs
-    site_bank_options = []
-    for window in jendela.values():
-        for site, banks in window.items():
-            for bank in banks:
-                site_bank_options.append(f"{site} → {bank}")
+        # Get all site-bank pairs
+        site_bank_options = []
+        for window in jendela.values():
+            for site, banks in window.items():
+                for bank in banks:
+                    site_bank_options.append(f"{site} → {bank}")
     
-    acc_tabs = st.tabs(["Lihat Akun", "Tambah Akun", "Edit Akun"])
+        acc_tabs = st.tabs(["Lihat Akun", "Tambah Akun", "Edit Akun"])
     
-    with acc_tabs[0]:
-        st.write("### Akun Terdaftar")
-        for site in accounts.get("accounts", {}):
-            with st.expander(f"🔒 {site}"):
-                for acc in accounts["accounts"][site]:
-                    st.write(f"🏦 **{acc.get('bank', 'N/A')}**")
-                    st.write(f"👤 `{acc.get('username', 'N/A')}`")
-                    st.write(f"🔒 `{'*' * len(acc.get('password', ''))}`")
-                    st.divider()
+        with acc_tabs[0]:
+            st.write("### Akun Terdaftar")
+            for site in accounts.get("accounts", {}):
+                with st.expander(f"🔒 {site}"):
+                    for acc in accounts["accounts"][site]:
+                        st.write(f"🏦 **{acc.bank or 'N/A'}**")
+                        st.write(f"👤 `{acc.username or 'N/A'}`")
+                        st.write(f"🔒 `{'*' * len(acc.password)}`")
+                        st.divider()
     
-    with acc_tabs[1]:
-        st.write("### Tambah Akun Baru")
-        with st.form("add_account_form", clear_on_submit=True):
-            site_bank = st.selectbox("Pilih Situs & Bank*", site_bank_options)
-            username = st.text_input("Username*")
-            password = st.text_input("Password*", type="password")
+        with acc_tabs[1]:
+            st.write("### Tambah Akun Baru")
+            with st.form("add_account_form", clear_on_submit=True):
+                site_bank = st.selectbox("Pilih Situs & Bank*", site_bank_options)
+                username = st.text_input("Username*")
+                password = st.text_input("Password*", type="password")
             
-            if st.form_submit_button("💾 Simpan"):
-                if not all([site_bank, username, password]):
-                    st.error("Harap isi semua field!")
-                else:
-                    site, bank = site_bank.split(" → ")
+                if st.form_submit_button("💾 Simpan"):
+                    if not all([site_bank, username, password]):
+                        st.error("Harap isi semua field!")
+                    else:
+                        site, bank = site_bank.split(" → ")
                     
-                    if site not in accounts["accounts"]:
-                        accounts["accounts"][site] = []
+                        if site not in accounts["accounts"]:
+                            accounts["accounts"][site] = []
                     
-                    accounts["accounts"][site].append({
-                        "bank": bank,
-                        "username": username,
-                        "password": password
-                    })
-                    save_data()
-                    st.success(f"Akun {username} untuk {site} ({bank}) tersimpan!")
-                    st.rerun()
+                        accounts["accounts"][site].append(Account(bank, username, password))
+                        if try_save(save_accounts):
+                            st.success(f"Akun {username} untuk {site} ({bank}) tersimpan!")
+                            st.rerun()
     
-    with acc_tabs[2]:
-        st.write("### Edit Akun")
-        if accounts.get("accounts", {}):
-            selected_site = st.selectbox("Situs", list(accounts["accounts"].keys()), key="edit_acc_site")
+        with acc_tabs[2]:
+            st.write("### Edit Akun")
+            if accounts.get("accounts", {}):
+                selected_site = st.selectbox("Situs", list(accounts["accounts"].keys()), key="edit_acc_site")
             
-            if selected_site in accounts["accounts"] and accounts["accounts"][selected_site]:
-                account_options = [
-                    f"{acc.get('bank', 'N/A')} | {acc.get('username', 'N/A')}" 
-                    for acc in accounts["accounts"][selected_site]
-                ]
+                if selected_site in accounts["accounts"] and accounts["accounts"][selected_site]:
+                    account_options = [
+                        f"{acc.bank or 'N/A'} | {acc.username or 'N/A'}" 
+                        for acc in accounts["accounts"][selected_site]
+                    ]
                 
-                selected_account = st.selectbox(
-                    "Pilih Akun", 
-                    account_options,
-                    key="edit_acc_select"
-                )
+                    selected_account = st.selectbox(
+                        "Pilih Akun", 
+                        account_options,
+                        key="edit_acc_select"
+                    )
                 
-                acc_index = account_options.index(selected_account)
-                acc_data = accounts["accounts"][selected_site][acc_index]
+                    acc_index = account_options.index(selected_account)
+                    acc_data = accounts["accounts"][selected_site][acc_index]
                 
-                with st.form("edit_account_form"):
-                    new_username = st.text_input("Username", value=acc_data.get("username", ""))
-                    new_password = st.text_input("Password", value=acc_data.get("password", ""), type="password")
+                    with st.form("edit_account_form"):
+                        new_username = st.text_input("Username", value=acc_data.username)
+                        new_password = st.text_input("Password", value=acc_data.password, type="password")
                     
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        if st.form_submit_button("💾 Update"):
-                            accounts["accounts"][selected_site][acc_index] = {
-                                "bank": acc_data.get("bank", ""),
-                                "username": new_username,
-                                "password": new_password
-                            }
-                            save_data()
-                            st.success("Akun diperbarui!")
-                            st.rerun()
-                    with col2:
-                        if st.form_submit_button("🗑️ Hapus", type="secondary"):
-                            del accounts["accounts"][selected_site][acc_index]
-                            if not accounts["accounts"][selected_site]:
-                                del accounts["accounts"][selected_site]
-                            save_data()
-                            st.success("Akun dihapus!")
-                            st.rerun()
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            if st.form_submit_button("💾 Update"):
+                                accounts["accounts"][selected_site][acc_index] = Account(
+                                    acc_data.bank, new_username, new_password
+                                )
+                                if try_save(save_accounts):
+                                    st.success("Akun diperbarui!")
+                                    st.rerun()
+                        with col2:
+                            if st.form_submit_button("🗑️ Hapus", type="secondary"):
+                                del accounts["accounts"][selected_site][acc_index]
+                                if not accounts["accounts"][selected_site]:
+                                    del accounts["accounts"][selected_site]
+                                if try_save(save_accounts):
+                                    st.success("Akun dihapus!")
+                                    st.rerun()
+                else:
+                    st.warning("Tidak ada akun untuk situs ini")
             else:
-                st.warning("Tidak ada akun untuk situs ini")
-        else:
-            st.warning("Belum ada akun terdaftar")
+                st.warning("Belum ada akun terdaftar")
 
 if __name__ == "__main__":
+    main()
     st.balloons()
\ No newline at end of file
@@ -3,8 +3,12 @@ import random
 import json
 import os
 import pathlib
+import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime, time, timedelta
-import pytz
+from time import perf_counter
+from streamlit.logger import get_logger
 
 # ========== CONSTANTS ==========
 DEFAULT_JENDELA = {
@@ -14,7 +18,86 @@ DEFAULT_JENDELA = {
 }
 DEFAULT_ACCOUNTS = {"accounts": {}}
 DEFAULT_HISTORY = {"history": {}, "status": {}}
-TIMEZONE = pytz.timezone("Asia/Jakarta")
+# Files without a "schema_version" key are version 0 and get migrated on load
+SCHEMA_VERSION = 1
+TIMEZONE_NAME = "Asia/Jakarta"
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "tsv": "text/tab-separated-values"
+}
+
+# ========== LAZY INITIALIZATION ==========
+# Streamlit re-executes this script on every rerun, so anything that should
+# happen once per process lives behind st.cache_resource.
+def process_start_time():
+    """Epoch seconds when this server process started, or None without /proc"""
+    try:
+        with open("/proc/self/stat") as f:
+            # Fields after the parenthesized command name; starttime is field 22
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/stat") as f:
+            boot_time = next(int(line.split()[1]) for line in f if line.startswith("btime "))
+    except (OSError, ValueError, IndexError, StopIteration):
+        return None
+    return boot_time + start_ticks / os.sysconf("SC_CLK_TCK")
+
+@st.cache_resource(show_spinner=False)
+def get_startup_report():
+    """Cold-start timings in ms, recorded the first time each step runs in this process"""
+    return {}
+
+@contextmanager
+def startup_step(name):
+    start = perf_counter()
+    yield
+    get_startup_report().setdefault(name, round((perf_counter() - start) * 1000, 1))
+
+@st.cache_resource(show_spinner=False)
+def get_timezone():
+    with startup_step("timezone"):
+        import pytz
+        return pytz.timezone(TIMEZONE_NAME)
+
+# ========== RECORD TYPES ==========
+class Transfer:
+    """One row of a daily plan; repeated strings are interned and shared"""
+    __slots__ = ("akun", "bank", "tipe_game", "waktu_transfer", "status_akses", "jendela")
+
+    def __init__(self, akun, bank, tipe_game, waktu_transfer, status_akses, jendela):
+        self.akun = sys.intern(akun)
+        self.bank = sys.intern(bank)
+        self.tipe_game = sys.intern(tipe_game)
+        self.waktu_transfer = sys.intern(waktu_transfer)
+        self.status_akses = sys.intern(status_akses)
+        self.jendela = sys.intern(jendela)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(*(data[field] for field in cls.__slots__))
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+class Account:
+    """Login for one site/bank pair"""
+    __slots__ = ("bank", "username", "password")
+
+    def __init__(self, bank="", username="", password=""):
+        self.bank = sys.intern(bank)
+        self.username = username
+        self.password = password
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("bank", ""), data.get("username", ""), data.get("password", ""))
+
+    def to_dict(self):
+        return {"bank": self.bank, "username": self.username, "password": self.password}
+
+def make_banks(banks):
+    """Site bank list as a tuple of interned names"""
+    return tuple(sys.intern(b) for b in banks)
 
 # ========== DATA MANAGEMENT ==========
 def get_config_path(filename):
@@ -30,102 +113,462 @@ def get_config_path(filename):
             return path
     return None
 
+# Normalizers take the JSON shape and return it cleaned, raising ValueError
+# when the data can't be repaired. They run on write and on migration only,
+# so loaders can trust a current-version file as-is.
+def normalize_jendela(data):
+    if not isinstance(data, dict):
+        raise ValueError("jendela config must map window names to sites")
+    result = {}
+    for name, sites in data.items():
+        if not isinstance(name, str) or not name.strip() or not isinstance(sites, dict):
+            raise ValueError(f"Invalid window: {name!r}")
+        result[name] = {}
+        for site, banks in sites.items():
+            if not isinstance(site, str) or not site.strip():
+                raise ValueError(f"Invalid site in {name}: {site!r}")
+            banks = [b.strip() for b in banks if isinstance(b, str) and b.strip()]
+            if banks:
+                result[name][site] = banks
+    return result
+
+def normalize_accounts(data):
+    if not isinstance(data, dict) or not isinstance(data.get("accounts"), dict):
+        raise ValueError("auth config must contain an accounts mapping")
+    result = {}
+    for site, acc_list in data["accounts"].items():
+        if not isinstance(acc_list, list):
+            raise ValueError(f"Invalid account list for {site!r}")
+        result[site] = [
+            {field: str(acc.get(field, "")) for field in Account.__slots__}
+            for acc in acc_list if isinstance(acc, dict)
+        ]
+    return {"accounts": result}
+
+def normalize_history(data):
+    if not isinstance(data, dict) or not all(k in data for k in DEFAULT_HISTORY):
+        raise ValueError("history must contain history and status mappings")
+    result = {}
+    for date, rows in data["history"].items():
+        # Legacy non-date entries such as "last_jendela" are dropped
+        if not isinstance(rows, list):
+            continue
+        datetime.fromisoformat(date)
+        for t in rows:
+            if not isinstance(t, dict) or not all(isinstance(t.get(f), str) for f in Transfer.__slots__):
+                raise ValueError(f"Invalid transfer on {date}: {t!r}")
+        result[date] = rows
+    return {"history": result, "status": dict(data["status"])}
+
+def read_config(filename, migrate):
+    """Read a versioned config file, migrating an older version once.
+
+    migrate turns version 0 data into the current shape. Returns None if
+    the file is missing; raises ValueError if it can't be used.
+    """
+    path = get_config_path(filename)
+    if not path:
+        return None
+    with open(path, "r") as f:
+        data = json.load(f)
+    
+    version = data.get("schema_version", 0) if isinstance(data, dict) else 0
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"{filename} has schema version {version}, newer than supported {SCHEMA_VERSION}")
+    if version == SCHEMA_VERSION:
+        return data
+    
+    data = migrate(data)
+    write_config(filename, data)
+    return data
+
 def load_jendela():
-    path = get_config_path("jendela_config.json")
-    if path:
-        with open(path, "r") as f:
-            data = json.load(f)
-            if all(k in data for k in DEFAULT_JENDELA):
-                return data
-    return DEFAULT_JENDELA.copy()
+    # Version 0 stored the windows at the top level
+    data = read_config("jendela_config.json", lambda d: {"jendela": normalize_jendela(d)})
+    if data:
+        return {
+            sys.intern(name): {sys.intern(site): make_banks(banks) for site, banks in sites.items()}
+            for name, sites in data["jendela"].items()
+        }
+    return {name: {} for name in DEFAULT_JENDELA}
 
 def load_accounts():
-    path = get_config_path("auth_config.json")
-    if path:
-        with open(path, "r") as f:
-            data = json.load(f)
-            if "accounts" in data:
-                return data
-    return DEFAULT_ACCOUNTS.copy()
+    data = read_config("auth_config.json", normalize_accounts)
+    if data:
+        return {"accounts": {
+            sys.intern(site): [Account.from_dict(acc) for acc in acc_list]
+            for site, acc_list in data["accounts"].items()
+        }}
+    return {"accounts": {}}
 
 def load_history():
-    path = get_config_path("history_advanced.json")
-    if path:
-        with open(path, "r") as f:
-            data = json.load(f)
-            if all(k in data for k in DEFAULT_HISTORY):
-                return data
-    return DEFAULT_HISTORY.copy()
-
-def save_data():
-    """Save data to existing files only"""
-    configs = {
-        "jendela_config.json": jendela,
-        "auth_config.json": accounts,
-        "history_advanced.json": history
+    data = read_config("history_advanced.json", normalize_history)
+    if data:
+        return {
+            "history": {
+                date: [Transfer.from_dict(t) for t in rows]
+                for date, rows in data["history"].items()
+            },
+            "status": data["status"]
+        }
+    return {"history": {}, "status": {}}
+
+def accounts_to_json(data):
+    return {"accounts": {
+        site: [acc.to_dict() for acc in acc_list]
+        for site, acc_list in data["accounts"].items()
+    }}
+
+def history_to_json(data):
+    return {
+        "history": {
+            date: [t.to_dict() for t in rows]
+            for date, rows in data["history"].items()
+        },
+        "status": data["status"]
     }
+
+def write_config(filename, data):
+    """Write data to an existing config file, stamped with the schema version"""
+    path = get_config_path(filename)
+    if path:
+        # Replace atomically so watching sessions never read a half-written file
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"schema_version": SCHEMA_VERSION, **data}, f, indent=2)
+        os.replace(tmp_path, path)
+
+def save_jendela():
+    """Validate and save the window config only"""
+    with writing_cached("jendela_config.json", jendela):
+        write_config("jendela_config.json", {"jendela": normalize_jendela(jendela)})
+
+def save_accounts():
+    """Validate and save the account config only"""
+    with writing_cached("auth_config.json", accounts):
+        write_config("auth_config.json", normalize_accounts(accounts_to_json(accounts)))
+
+def save_history():
+    """Save the history file; callers hold get_history_lock() and have just re-read it"""
+    with writing_cached("history_advanced.json", history):
+        write_config("history_advanced.json", normalize_history(history_to_json(history)))
+
+@st.cache_resource
+def get_history_lock():
+    """Process-wide lock so sessions generating different windows don't clobber each other"""
+    return threading.Lock()
+
+# ========== CHANGE NOTIFICATION ==========
+DATA_FILES = ("jendela_config.json", "auth_config.json", "history_advanced.json")
+
+def file_signature(filename):
+    path = get_config_path(filename)
+    if not path:
+        return None
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+class DataWatcher:
+    """Watches the data files for changes made by any session, process or script.
+
+    Each change bumps that file's version and reruns the open sessions, so
+    idle ones refresh without user input. Sessions compare versions to decide
+    whether they need to re-parse a file at all.
+    """
+
+    def __init__(self):
+        from streamlit.watcher.path_watcher import get_path_watcher_class
+        
+        self.versions = dict.fromkeys(DATA_FILES, 0)
+        self._sessions = set()
+        self._own_writes = {}
+        self._stale = set()
+        self._lock = threading.Lock()
+        
+        # watchdog (inotify and friends) when installed, polling otherwise
+        watcher_class = get_path_watcher_class("auto")
+        base_dir = pathlib.Path(__file__).parent
+        self._watchers = [
+            watcher_class(
+                str(get_config_path(filename) or base_dir / filename),
+                lambda _, filename=filename: self._on_changed(filename),
+                allow_nonexistent=True
+            )
+            for filename in DATA_FILES
+        ]
+
+    def register_session(self):
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        
+        ctx = get_script_run_ctx()
+        if ctx:
+            with self._lock:
+                self._sessions.add(ctx.session_id)
+
+    def expect_write(self, filename):
+        """Note a write by the current session so it isn't rerun for its own change"""
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        
+        ctx = get_script_run_ctx()
+        if ctx:
+            with self._lock:
+                self._own_writes[filename] = (file_signature(filename), ctx.session_id)
+
+    def _on_changed(self, filename):
+        with self._lock:
+            self.versions[filename] += 1
+            signature, writer = self._own_writes.pop(filename, (None, None))
+        if signature is None or signature != file_signature(filename):
+            writer = None
+        self._rerun_sessions(skip=writer)
+
+    def _rerun_sessions(self, skip=None):
+        from streamlit.runtime import Runtime
+        from streamlit.runtime.app_session import AppSessionState
+        
+        if not Runtime.exists():
+            return
+        # Streamlit has no public API for rerunning another session; with
+        # runOnSave it reruns a session after a source change the same way,
+        # passing the session's last client state so widget values are kept.
+        session_mgr = getattr(Runtime.instance(), "_session_mgr", None)
+        if session_mgr is None:
+            return
+        with self._lock:
+            sessions = list(self._sessions)
+        for session_id in sessions:
+            if session_id == skip:
+                continue
+            info = session_mgr.get_active_session_info(session_id)
+            if info is None:
+                # Closed or disconnected; it re-registers on its next run
+                with self._lock:
+                    self._sessions.discard(session_id)
+                    self._stale.discard(session_id)
+            elif getattr(info.session, "_state", None) == AppSessionState.APP_NOT_RUNNING:
+                info.session.request_rerun(info.session._client_state)
+            else:
+                # Mid-run, it may already have read the old file; a rerun request
+                # now would cut that run short, so it checks in when it finishes
+                with self._lock:
+                    self._stale.add(session_id)
+
+    def take_stale(self):
+        """Whether the current session's run overlapped a data change it must rerun for"""
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        
+        ctx = get_script_run_ctx()
+        if not ctx:
+            return False
+        with self._lock:
+            if ctx.session_id not in self._stale:
+                return False
+            self._stale.discard(ctx.session_id)
+        return True
+
+@st.cache_resource(show_spinner=False)
+def get_data_watcher():
+    with startup_step("watcher"):
+        return DataWatcher()
+
+def load_cached(filename, loader):
+    """This session's parsed copy of a data file.
+
+    Reused until the watcher bumps the file's version, and even then only
+    re-parsed if the file differs from what this session last read or wrote.
+    """
+    watcher = get_data_watcher()
+    watcher.register_session()
+    cache = st.session_state.setdefault("data_cache", {})
+    version = watcher.versions[filename]
     
-    for filename, data in configs.items():
-        path = get_config_path(filename)
-        if path:
-            with open(path, "w") as f:
-                json.dump(data, f, indent=2)
+    if filename in cache:
+        cached_version, signature, data = cache[filename]
+        if cached_version == version:
+            return data
+        if signature == file_signature(filename):
+            cache[filename] = (version, signature, data)
+            return data
+    
+    # Stat before reading so a write racing the read still looks changed next time
+    signature = file_signature(filename)
+    data = loader()
+    cache[filename] = (version, signature, data)
+    return data
+
+@contextmanager
+def writing_cached(filename, data):
+    """Write this session's copy of a data file.
+
+    On success the copy stays cached, so the session's own change isn't
+    re-parsed. If the write fails the copy is dropped instead: the UI edits
+    it in place before saving, and the bad edit must not outlive the save.
+    """
+    watcher = get_data_watcher()
+    cache = st.session_state.setdefault("data_cache", {})
+    try:
+        yield
+    except Exception:
+        cache.pop(filename, None)
+        raise
+    watcher.expect_write(filename)
+    cache[filename] = (watcher.versions[filename], file_signature(filename), data)
 
 # ========== CORE FUNCTIONS ==========
 def clean_old_history():
-    today = datetime.now(TIMEZONE).date()
+    today = datetime.now(get_timezone()).date()
     expired = [
         k for k in history["history"] 
-        if k != "last_jendela" 
-        and (today - datetime.fromisoformat(k).date()).days > 10
+        if (today - datetime.fromisoformat(k).date()).days > 10
     ]
     for date in expired:
         del history["history"][date]
     return len(expired)
 
-def generate_transfers():
-    today = datetime.now(TIMEZONE)
-    date_key = today.date().isoformat()
-    
-    if date_key in history["history"] and not st.session_state.get('override', False):
-        return False
-    
+def generate_window(j_name, sites, now):
+    """Build the transfer plan for a single window, independent of the others"""
     result = []
-    is_hongkong = time(14, 0) <= today.time() <= time(23, 59)
+    tipe_game = "Hongkong" if time(14, 0) <= now.time() <= time(23, 59) else "Sidney"
+    waktu_transfer = now.isoformat()
     
-    for j_name, accounts_in_window in jendela.items():
-        if not accounts_in_window:
-            continue
-            
-        shuffled = random.sample(list(accounts_in_window.items()), len(accounts_in_window))
+    shuffled = random.sample(list(sites.items()), len(sites))
+    
+    for acc, banks in shuffled:
+        bank = random.choice(banks)
+        status_key = f"{acc}_{bank}"
         
-        for acc, banks in shuffled:
-            valid_banks = [b for b in banks if b and b.strip()]
-            if not valid_banks:
-                continue
-                
-            bank = random.choice(valid_banks)
-            status_key = f"{acc}_{bank}"
-            
-            result.append({
-                "akun": acc,
-                "bank": bank,
-                "tipe_game": "Hongkong" if is_hongkong else "Sidney",
-                "waktu_transfer": today.isoformat(),
-                "status_akses": history["status"].get(status_key, "OK"),
-                "jendela": j_name
-            })
+        result.append(Transfer(
+            acc,
+            bank,
+            tipe_game,
+            waktu_transfer,
+            history["status"].get(status_key, "OK"),
+            j_name
+        ))
+    return result
+
+def generate_transfers(window_names=None):
+    """Generate today's plan for the given windows (all by default).
+
+    Rows belonging to other windows are kept as they are. Windows without
+    sites are skipped, and so are windows that already have a plan today
+    unless override is on. Returns False when nothing was generated.
+    """
+    global history
+    today = datetime.now(get_timezone())
+    date_key = today.date().isoformat()
+    # An empty list means no windows, and windows without sites have nothing to plan
+    targets = [w for w in (jendela if window_names is None else window_names) if jendela.get(w)]
     
-    expired_count = clean_old_history()
-    history["history"][date_key] = result
-    save_data()
+    with get_history_lock():
+        # Re-read so plans written by other sessions since our load are kept
+        history = load_history()
+        day = history["history"].get(date_key, [])
+        
+        if not st.session_state.get('override', False):
+            generated = {t.jendela for t in day}
+            targets = [w for w in targets if w not in generated]
+        if not targets:
+            return False
+        
+        plans = {w: generate_window(w, jendela[w], today) for w in targets}
+        kept = [t for t in day if t.jendela not in plans]
+        
+        expired_count = clean_old_history()
+        history["history"][date_key] = kept + [t for w in targets for t in plans[w]]
+        save_history()
     return expired_count
 
+def move_window_plan(old_name, new_name=None):
+    """Move today's rows of a renamed window to its new name, or drop them if deleted"""
+    global history
+    if old_name == new_name:
+        return
+    date_key = datetime.now(get_timezone()).date().isoformat()
+    
+    with get_history_lock():
+        history = load_history()
+        day = history["history"].get(date_key)
+        if not day or not any(t.jendela == old_name for t in day):
+            return
+        if new_name is None:
+            history["history"][date_key] = [t for t in day if t.jendela != old_name]
+        else:
+            for t in day:
+                if t.jendela == old_name:
+                    t.jendela = sys.intern(new_name)
+        save_history()
+
+# ========== EXPORT ==========
+def iter_transfers(data, start, end=None, window_names=None):
+    """Yield (date, transfer) pairs for days start..end, oldest first"""
+    start = str(start)
+    end = str(end) if end else start
+    wanted = set(window_names) if window_names is not None else None
+    
+    date_keys = sorted(
+        k for k in data["history"]
+        if start <= k <= end
+    )
+    for date_key in date_keys:
+        for t in data["history"][date_key]:
+            if wanted is None or t.jendela in wanted:
+                yield date_key, t
+
+def iter_export(fmt, start, end=None, window_names=None, data=None):
+    """Stream plans as text chunks (one per row) in csv, jsonl or tsv"""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if data is None:
+        data = load_history()
+    rows = iter_transfers(data, start, end, window_names)
+    
+    if fmt == "jsonl":
+        for date_key, t in rows:
+            yield json.dumps({"tanggal": date_key, **t.to_dict()}) + "\n"
+        return
+    
+    import csv
+    import io
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter="\t" if fmt == "tsv" else ",")
+    writer.writerow(("tanggal",) + Transfer.__slots__)
+    for date_key, t in rows:
+        writer.writerow((date_key,) + tuple(getattr(t, field) for field in Transfer.__slots__))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+def export_transfers(out, fmt="csv", start=None, end=None, window_names=None, data=None):
+    """Write an export to a path or an open text file.
+
+    Defaults to today's plan for every window, e.g.
+    export_transfers("plan.csv") or export_transfers(sys.stdout, "jsonl", "2025-08-01", "2025-08-10").
+    """
+    if start is None:
+        start = datetime.now(get_timezone()).date()
+    if isinstance(out, (str, os.PathLike)):
+        with open(out, "w", newline="", encoding="utf-8") as f:
+            f.writelines(iter_export(fmt, start, end, window_names, data))
+    else:
+        out.writelines(iter_export(fmt, start, end, window_names, data))
+
 # ========== UI COMPONENTS ==========
-def show_transfer_results(date_key):
+def show_transfer_results(date_key, window_names=None):
+    wanted = set(window_names) if window_names is not None else None
     window_groups = {}
     for transfer in history["history"].get(date_key, []):
-        window_groups.setdefault(transfer["jendela"], []).append(transfer)
+        if wanted is None or transfer.jendela in wanted:
+            window_groups.setdefault(transfer.jendela, []).append(transfer)
+    
+    if not window_groups:
+        st.info("Belum ada hasil untuk jendela yang dipilih")
+        return
     
     cols = st.columns(min(3, len(window_groups)))
     for idx, (window, transfers) in enumerate(window_groups.items()):
@@ -133,40 +576,110 @@ def show_transfer_results(date_key):
             with st.expander(f"🪟 {window.upper()} ({len(transfers)} transfer)", True):
                 for t in transfers:
                     matched = [
-                        acc for acc in accounts["accounts"].get(t['akun'], [])
-                        if acc.get("bank") == t['bank']
+                        acc for acc in accounts["accounts"].get(t.akun, [])
+                        if acc.bank == t.bank
                     ]
                     
                     st.markdown(f"""
-                    **{t['akun']}** → `{t['bank']}`  
-                    🎮 **{t['tipe_game']}**  
-                    ⏱️ {datetime.fromisoformat(t['waktu_transfer']).strftime('%H:%M')}  
-                    {"🟢" if t['status_akses'] == "OK" else "🔴"} {t['status_akses']}
+                    **{t.akun}** → `{t.bank}`  
+                    🎮 **{t.tipe_game}**  
+                    ⏱️ {datetime.fromisoformat(t.waktu_transfer).strftime('%H:%M')}  
+                    {"🟢" if t.status_akses == "OK" else "🔴"} {t.status_akses}
                     """)
                     
                     if matched:
                         with st.popover("🔑 Lihat Login"):
                             for acc in matched:
-                                st.write(f"👤 `{acc.get('username', 'N/A')}`")
-                                st.write(f"🔒 `{acc.get('password', 'N/A')}`")
+                                st.write(f"👤 `{acc.username or 'N/A'}`")
+                                st.write(f"🔒 `{acc.password or 'N/A'}`")
                                 st.divider()
                     st.divider()
 
+def show_export_panel(today):
+    with st.expander("📤 Export"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            dates = st.date_input("Tanggal", value=(today, today), key="export_dates")
+        with col2:
+            window = st.selectbox("Jendela", ["Semua"] + list(jendela.keys()), key="export_window")
+        with col3:
+            fmt = st.selectbox("Format", list(EXPORT_FORMATS), key="export_format")
+        
+        # The range picker returns a single date while the end is still being chosen
+        start, end = (dates[0], dates[-1]) if dates else (today, today)
+        window_names = None if window == "Semua" else [window]
+        suffix = "" if window_names is None else f"_{window}"
+        
+        # Built only on request and kept for this selection, so ordinary reruns
+        # don't re-serialize the whole range; a history change makes it stale
+        selection = (fmt, start, end, window, get_data_watcher().versions["history_advanced.json"])
+        if st.button("📦 Siapkan export", use_container_width=True):
+            content = "".join(iter_export(fmt, start, end, window_names, history)).encode("utf-8")
+            st.session_state.export_file = (selection, content)
+        
+        prepared = st.session_state.get("export_file")
+        if prepared and prepared[0] == selection:
+            st.download_button(
+                "⬇️ Download",
+                prepared[1],
+                file_name=f"transfer_{start}_{end}{suffix}.{fmt}",
+                mime=EXPORT_FORMATS[fmt],
+                use_container_width=True
+            )
+
+def try_save(save):
+    """Run a save, showing invalid data as an error instead of a traceback"""
+    try:
+        save()
+    except ValueError as e:
+        st.error(f"Data tidak valid: {e}")
+        return False
+    return True
+
 # ========== MAIN APP ==========
+def show_startup_report():
+    with st.sidebar.expander("⏱️ Startup timing"):
+        st.json(get_startup_report())
+
 def main():
+    cold_start = "first_page" not in get_startup_report()
+    with startup_step("first_page"):
+        render_app()
+    if cold_start:
+        started = process_start_time()
+        if started is not None:
+            get_startup_report()["process_start_to_first_page"] = round(
+                (datetime.now().timestamp() - started) * 1000
+            )
+        # Also goes to the server log so restarts can be compared
+        get_logger(__name__).info("Startup timing (ms): %s", get_startup_report())
+    show_startup_report()
+    if get_data_watcher().take_stale():
+        # A data file changed while this run was using it
+        st.rerun()
+
+def render_app():
     # Initialize session state
     if 'bank_count' not in st.session_state:
         st.session_state.bank_count = 1
     if 'edit_bank_count' not in st.session_state:
         st.session_state.edit_bank_count = 1
     
+    st.set_page_config(layout="wide", page_title="Auto Transfer Pro")
+    
     # Load data
     global jendela, accounts, history
-    jendela = load_jendela()
-    accounts = load_accounts()
-    history = load_history()
+    try:
+        with startup_step("load_jendela"):
+            jendela = load_cached("jendela_config.json", load_jendela)
+        with startup_step("load_accounts"):
+            accounts = load_cached("auth_config.json", load_accounts)
+        with startup_step("load_history"):
+            history = load_cached("history_advanced.json", load_history)
+    except ValueError as e:
+        st.error(f"Data config tidak valid: {e}")
+        st.stop()
     
-    st.set_page_config(layout="wide", page_title="Auto Transfer Pro")
     st.title("🔄 Auto Transfer Generator Pro")
     
     # Main tabs
@@ -179,27 +692,38 @@ def main():
         with col2:
             st.session_state.override = st.checkbox("Force Regenerate")
         
+        window_names = list(jendela.keys())
+        selected_windows = st.multiselect(
+            "Jendela", window_names, default=window_names, key="generate_windows"
+        )
+        
         if st.button("🚀 Generate Sekarang", type="primary", use_container_width=True):
-            if not any(jendela.values()):
+            if not any(jendela[w] for w in selected_windows):
                 st.error("No sites registered!")
             else:
                 with st.spinner("Processing..."):
-                    expired_count = generate_transfers()
-                    if expired_count > 0:
-                        st.info(f"Cleaned {expired_count} expired entries")
-                    st.success("Generated successfully!")
-                    st.rerun()
+                    expired_count = generate_transfers(selected_windows)
+                    if expired_count is False:
+                        st.warning("Jendela terpilih sudah di-generate hari ini atau belum punya situs")
+                    else:
+                        if expired_count > 0:
+                            st.info(f"Cleaned {expired_count} expired entries")
+                        st.success("Generated successfully!")
+                        st.rerun()
         
-        today_key = datetime.now(TIMEZONE).date().isoformat()
+        today_key = datetime.now(get_timezone()).date().isoformat()
         if today_key in history["history"]:
             st.divider()
             st.subheader(f"📋 Hasil {today_key}")
-            show_transfer_results(today_key)
+            show_transfer_results(today_key, selected_windows)
+        
+        st.divider()
+        show_export_panel(datetime.now(get_timezone()).date())
 
     with tab2:
         st.subheader("🗃️ Kelola Situs")
         
-        crud_tabs = st.tabs(["Lihat Situs", "Tambah Situs", "Edit/Hapus"])
+        crud_tabs = st.tabs(["Lihat Situs", "Tambah Situs", "Edit/Hapus", "Kelola Jendela"])
         
         with crud_tabs[0]:
             st.write("### Daftar Situs Terdaftar")
@@ -234,20 +758,23 @@ def main():
                         banks.append(bank.strip())
                 
                 if st.form_submit_button("💾 Simpan"):
-                    if not site_name or not banks:
+                    site_name = site_name.strip()
+                    if not window:
+                        st.error("Tambahkan jendela terlebih dahulu!")
+                    elif not site_name or not banks:
                         st.error("Harap isi nama situs dan minimal 1 bank!")
                     else:
-                        jendela[window][site_name] = banks
-                        save_data()
-                        st.session_state.bank_count = 1
-                        st.success(f"Situs {site_name} ditambahkan!")
-                        st.rerun()
+                        jendela[window][site_name] = make_banks(banks)
+                        if try_save(save_jendela):
+                            st.session_state.bank_count = 1
+                            st.success(f"Situs {site_name} ditambahkan!")
+                            st.rerun()
         
         with crud_tabs[2]:
             st.write("### Edit Situs")
             selected_window = st.selectbox("Pilih Jendela", list(jendela.keys()), key="edit_window")
             
-            if jendela[selected_window]:
+            if selected_window and jendela[selected_window]:
                 selected_site = st.selectbox("Pilih Situs", list(jendela[selected_window].keys()), key="edit_site")
                 current_banks = jendela[selected_window][selected_site]
                 
@@ -269,24 +796,83 @@ def main():
                     col1, col2 = st.columns(2)
                     with col1:
                         if st.form_submit_button("💾 Update"):
-                            if not new_banks:
+                            new_name = new_name.strip()
+                            if not new_name:
+                                st.error("Harap isi nama situs!")
+                            elif new_name != selected_site and new_name in jendela[selected_window]:
+                                st.error(f"Situs {new_name} sudah ada!")
+                            elif not new_banks:
                                 st.error("Harap isi minimal 1 bank!")
                             else:
                                 if new_name != selected_site:
                                     del jendela[selected_window][selected_site]
-                                jendela[selected_window][new_name] = new_banks
-                                save_data()
-                                st.session_state.edit_bank_count = len(new_banks)
-                                st.success("Data diperbarui!")
-                                st.rerun()
+                                jendela[selected_window][new_name] = make_banks(new_banks)
+                                if try_save(save_jendela):
+                                    st.session_state.edit_bank_count = len(new_banks)
+                                    st.success("Data diperbarui!")
+                                    st.rerun()
                     with col2:
                         if st.form_submit_button("🗑️ Hapus", type="secondary"):
                             del jendela[selected_window][selected_site]
-                            save_data()
-                            st.success("Situs dihapus!")
-                            st.rerun()
+                            if try_save(save_jendela):
+                                st.success("Situs dihapus!")
+                                st.rerun()
             else:
                 st.warning("Tidak ada situs di jendela ini")
+        
+        with crud_tabs[3]:
+            st.write("### Tambah Jendela")
+            with st.form("add_window_form", clear_on_submit=True):
+                new_window = st.text_input("Nama Jendela*", placeholder=f"jendela{len(jendela) + 1}")
+                
+                if st.form_submit_button("➕ Tambah Jendela"):
+                    new_window = new_window.strip()
+                    if not new_window:
+                        st.error("Harap isi nama jendela!")
+                    elif new_window in jendela:
+                        st.error(f"Jendela {new_window} sudah ada!")
+                    else:
+                        jendela[new_window] = {}
+                        if try_save(save_jendela):
+                            st.success(f"Jendela {new_window} ditambahkan!")
+                            st.rerun()
+            
+            st.write("### Rename/Hapus Jendela")
+            if jendela:
+                target_window = st.selectbox("Pilih Jendela", list(jendela.keys()), key="manage_window")
+                
+                with st.form("edit_window_form"):
+                    renamed = st.text_input("Nama Baru", value=target_window)
+                    
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        if st.form_submit_button("💾 Rename"):
+                            renamed = renamed.strip()
+                            if not renamed:
+                                st.error("Harap isi nama jendela!")
+                            elif renamed != target_window and renamed in jendela:
+                                st.error(f"Jendela {renamed} sudah ada!")
+                            else:
+                                # Rebuild in place to keep window order
+                                reordered = {
+                                    (renamed if name == target_window else name): sites
+                                    for name, sites in jendela.items()
+                                }
+                                jendela.clear()
+                                jendela.update(reordered)
+                                if try_save(save_jendela):
+                                    move_window_plan(target_window, renamed)
+                                    st.success("Jendela diperbarui!")
+                                    st.rerun()
+                    with col2:
+                        if st.form_submit_button("🗑️ Hapus", type="secondary"):
+                            del jendela[target_window]
+                            if try_save(save_jendela):
+                                move_window_plan(target_window)
+                                st.success(f"Jendela {target_window} dihapus!")
+                                st.rerun()
+            else:
+                st.warning("Belum ada jendela")
 
     with tab3:
         st.subheader("🔐 Kelola Akun Login")
@@ -305,9 +891,9 @@ def main():
             for site, acc_list in accounts.get("accounts", {}).items():
                 with st.expander(f"🔒 {site}"):
                     for acc in acc_list:
-                        st.write(f"🏦 **{acc.get('bank', 'N/A')}**")
-                        st.write(f"👤 `{acc.get('username', 'N/A')}`")
-                        st.write(f"🔒 `{acc.get('password', 'N/A')}`")
+                        st.write(f"🏦 **{acc.bank or 'N/A'}**")
+                        st.write(f"👤 `{acc.username or 'N/A'}`")
+                        st.write(f"🔒 `{acc.password or 'N/A'}`")
                         st.divider()
         
         with acc_tabs[1]:
@@ -322,12 +908,10 @@ def main():
                         st.error("Harap isi semua field!")
                     else:
                         site, bank = site_bank.split(" → ")
-                        accounts["accounts"].setdefault(site, []).append({
-                            "bank": bank,
-                            "username": username,
-                            "password": password
-                        })
-                        if save_data():
+                        accounts["accounts"].setdefault(site, []).append(
+                            Account(bank, username, password)
+                        )
+                        if try_save(save_accounts):
                             st.success(f"Akun {username} tersimpan!")
                             st.rerun()
         
@@ -338,7 +922,7 @@ def main():
                 
                 if selected_site in accounts["accounts"]:
                     account_options = [
-                        f"{acc.get('bank', 'N/A')} | {acc.get('username', 'N/A')}" 
+                        f"{acc.bank or 'N/A'} | {acc.username or 'N/A'}" 
                         for acc in accounts["accounts"][selected_site]
                     ]
                     selected_account = st.selectbox("Pilih Akun", account_options, key="edit_acc_select")
@@ -347,17 +931,15 @@ def main():
                     acc_data = accounts["accounts"][selected_site][acc_index]
                     
                     with st.form("edit_account_form"):
-                        new_username = st.text_input("Username", value=acc_data.get("username", ""))
-                        new_password = st.text_input("Password", value=acc_data.get("password", ""), type="password")
+                        new_username = st.text_input("Username", value=acc_data.username)
+                        new_password = st.text_input("Password", value=acc_data.password, type="password")
                         
                         col1, col2 = st.columns(2)
                         with col1:
                             if st.form_submit_button("💾 Update"):
-                                accounts["accounts"][selected_site][acc_index].update({
-                                    "username": new_username,
-                                    "password": new_password
-                                })
-                                if save_data():
+                                acc_data.username = new_username
+                                acc_data.password = new_password
+                                if try_save(save_accounts):
                                     st.success("Akun diperbarui!")
                                     st.rerun()
                         with col2:
@@ -365,7 +947,7 @@ def main():
                                 del accounts["accounts"][selected_site][acc_index]
                                 if not accounts["accounts"][selected_site]:
                                     del accounts["accounts"][selected_site]
-                                if save_data():
+                                if try_save(save_accounts):
                                     st.success("Akun dihapus!")
                                     st.rerun()
                 else: